@@ -1,9 +1,9 @@
-from fastapi import FastAPI, UploadFile, File, Depends, HTTPException, status, BackgroundTasks
+from fastapi import FastAPI, UploadFile, File, Depends, HTTPException, status, BackgroundTasks, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-import shutil
 import os
-import json
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -14,7 +14,8 @@ from models.summry import Summary
 from schemas.users import UserCreate, UserLogin, UserResponse, Token
 from schemas.recordings import RecordingResponse, RecordingList
 from schemas.summaries import SummaryResponse
-from transcription_service import TranscriptionService
+from transcription_service import transcription_service
+from file_storage import write_upload
 from auth import (
     verify_password, 
     get_password_hash, 
@@ -31,13 +32,13 @@ app = FastAPI(title="Voice-to-Text Meeting Assistant", version="1.0.0")
 # Security
 security = HTTPBearer()
 
-# Initialize transcription service
-transcription_service = TranscriptionService()
-
 # Ensure uploads directory exists
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
 
+# Number of transcript characters included in recording list items
+TRANSCRIPT_PREVIEW_LENGTH = 150
+
 ALLOWED_AUDIO_TYPES = {
     "audio/mpeg",       # .mp3
     "audio/mp4",        # .m4a
@@ -97,8 +98,8 @@ def process_transcription(recording_id: int, file_path: str):
         summary = Summary(
             title=f"Summary of {recording.title}",
             content=result["summary"],
-            action_items=json.dumps(action_items),
-            key_points=json.dumps(key_points),
+            action_items=action_items,
+            key_points=key_points,
             status="completed",
             recording_id=recording.id
         )
@@ -194,12 +195,10 @@ async def upload_recording(
     file_path = UPLOAD_DIR / unique_filename
     
     try:
-        # Save file to disk
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Save file to disk in a worker thread so the event loop isn't blocked
+        file_size = await run_in_threadpool(write_upload, file.file, file_path)
         
         # Get file info
-        file_size = os.path.getsize(file_path)
         file_type = file_extension.lstrip('.')
         
         # Create database record
@@ -238,12 +237,28 @@ async def upload_recording(
 
 @app.get("/recordings/", response_model=RecordingList)
 async def get_my_recordings(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all recordings for the authenticated user"""
-    recordings = db.query(Recording).filter(Recording.user_id == current_user.id).all()
-    return {"recordings": recordings, "total": len(recordings)}
+    """Get a page of recordings for the authenticated user"""
+    total = db.query(func.count(Recording.id)).filter(Recording.user_id == current_user.id).scalar()
+    # Only the list columns plus a transcript preview, as RecordingListItem expects
+    recordings = db.query(
+        Recording.id,
+        Recording.title,
+        Recording.filename,
+        Recording.file_size,
+        Recording.duration,
+        Recording.file_type,
+        Recording.status,
+        Recording.created_at,
+        func.substr(Recording.transcript, 1, TRANSCRIPT_PREVIEW_LENGTH).label("transcript_preview")
+    ).filter(
+        Recording.user_id == current_user.id
+    ).order_by(Recording.id).offset(skip).limit(limit).all()
+    return {"recordings": recordings, "total": total, "skip": skip, "limit": limit}
 
 @app.get("/recordings/{recording_id}", response_model=RecordingResponse)
 async def get_recording(
@@ -420,16 +435,16 @@ async def process_recording_now(
         
         if existing_summary:
             existing_summary.content = result["summary"]
-            existing_summary.action_items = json.dumps(action_items)
-            existing_summary.key_points = json.dumps(key_points)
+            existing_summary.action_items = action_items
+            existing_summary.key_points = key_points
             existing_summary.status = "completed"
             summary = existing_summary
         else:
             summary = Summary(
                 title=f"Summary of {recording.title}",
                 content=result["summary"],
-                action_items=json.dumps(action_items),
-                key_points=json.dumps(key_points),
+                action_items=action_items,
+                key_points=key_points,
                 status="completed",
                 recording_id=recording.id
             )
@@ -445,8 +460,8 @@ async def process_recording_now(
             "transcript": recording.transcript,
             "summary": {
                 "content": summary.content,
-                "action_items": json.loads(summary.action_items) if summary.action_items else [],
-                "key_points": json.loads(summary.key_points) if summary.key_points else []
+                "action_items": summary.action_items or [],
+                "key_points": summary.key_points or []
             },
             "duration": recording.duration,
             "status": recording.status
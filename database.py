@@ -10,7 +10,9 @@ def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.close()
 
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+# Objects stay loaded after commit; new rows get their id and server defaults
+# through INSERT ... RETURNING, so no refresh SELECT is needed
+SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
@@ -0,0 +1,11 @@
+import shutil
+
+# Uploads are copied to disk 1 MiB at a time
+COPY_CHUNK_SIZE = 1 << 20
+
+
+def write_upload(source, file_path) -> int:
+    """Stream an uploaded file to disk in 1 MiB chunks and return its size"""
+    with open(file_path, "wb") as buffer:
+        shutil.copyfileobj(source, buffer, COPY_CHUNK_SIZE)
+        return buffer.tell()
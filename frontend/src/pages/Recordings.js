@@ -42,10 +42,13 @@ const Recordings = () => {
 
   const handleViewSummary = async (recording) => {
     try {
-      const response = await recordingAPI.getSummary(recording.id);
+      const [recordingResponse, summaryResponse] = await Promise.all([
+        recordingAPI.getById(recording.id),
+        recordingAPI.getSummary(recording.id),
+      ]);
       setSelectedRecording({
-        ...recording,
-        summary: response.data
+        ...recordingResponse.data,
+        summary: summaryResponse.data
       });
       setShowSummary(true);
     } catch (error) {
@@ -138,10 +141,10 @@ const Recordings = () => {
                           <span>📅 {formatDate(recording.created_at)}</span>
                         </div>
 
-                        {recording.transcript && (
+                        {recording.transcript_preview && (
                           <div className="mt-3">
                             <p className="text-sm text-gray-600 line-clamp-2">
-                              <strong>Transcript:</strong> {recording.transcript.substring(0, 150)}...
+                              <strong>Transcript:</strong> {recording.transcript_preview}...
                             </p>
                           </div>
                         )}
@@ -217,12 +220,12 @@ const Recordings = () => {
                   )}
 
                   {/* Action Items */}
-                  {selectedRecording.summary?.action_items && JSON.parse(selectedRecording.summary.action_items).length > 0 && (
+                  {selectedRecording.summary?.action_items?.length > 0 && (
                     <div>
                       <h4 className="font-medium text-gray-900 mb-2">✅ Action Items</h4>
                       <div className="bg-yellow-50 border-l-4 border-yellow-500 p-4">
                         <ul className="list-disc list-inside space-y-1">
-                          {JSON.parse(selectedRecording.summary.action_items).map((item, index) => (
+                          {selectedRecording.summary.action_items.map((item, index) => (
                             <li key={index} className="text-sm text-gray-700">{item}</li>
                           ))}
                         </ul>
@@ -231,12 +234,12 @@ const Recordings = () => {
                   )}
 
                   {/* Key Points */}
-                  {selectedRecording.summary?.key_points && JSON.parse(selectedRecording.summary.key_points).length > 0 && (
+                  {selectedRecording.summary?.key_points?.length > 0 && (
                     <div>
                       <h4 className="font-medium text-gray-900 mb-2">🔑 Key Points</h4>
                       <div className="bg-purple-50 border-l-4 border-purple-500 p-4">
                         <ul className="list-disc list-inside space-y-1">
-                          {JSON.parse(selectedRecording.summary.key_points).map((point, index) => (
+                          {selectedRecording.summary.key_points.map((point, index) => (
                             <li key={index} className="text-sm text-gray-700">{point}</li>
                           ))}
                         </ul>
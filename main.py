@@ -1,11 +1,21 @@
-from fastapi import FastAPI, UploadFile, File, Form, Depends, HTTPException, status, BackgroundTasks
+from fastapi import FastAPI, UploadFile, File, Form, Depends, HTTPException, status, BackgroundTasks, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-import shutil
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import bindparam, exists, func, lambda_stmt, select
+from sqlalchemy.orm import Session, joinedload
+import aiofiles
+from anyio import from_thread
+import hashlib
 import os
-import json
+import sys
+import threading
+import time
+from cachetools import TTLCache
+from jose import jwt
 from pathlib import Path
+from typing import Optional
 from datetime import datetime, timedelta
 
 from database import get_db, engine, Base
@@ -15,9 +25,10 @@ from models.summry import Summary
 from schemas.users import UserCreate, UserLogin, UserResponse, Token
 from schemas.recordings import RecordingResponse, RecordingList
 from schemas.summaries import SummaryResponse
-from transcription_service import TranscriptionService
+from transcription_service import transcription_service
+from tasks import celery_app, transcribe_task
 from auth import (
-    verify_password, 
+    verify_and_update_password,
     get_password_hash, 
     create_access_token, 
     verify_token,
@@ -27,6 +38,11 @@ from auth import (
 # Create tables
 Base.metadata.create_all(bind=engine)
 
+# create_all skips existing tables, so add any indexes they are missing
+for table in Base.metadata.sorted_tables:
+    for index in table.indexes:
+        index.create(bind=engine, checkfirst=True)
+
 # Tags metadata for API documentation
 tags_metadata = [
     {
@@ -55,10 +71,46 @@ app = FastAPI(
     title="Voice-to-Text Meeting Assistant",
     version="1.0.0",
     description="A comprehensive AI-powered voice recording and transcription application with intelligent summarization",
-    openapi_tags=tags_metadata
+    openapi_tags=tags_metadata,
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware
+class MaxBodySizeMiddleware:
+    """Reject request bodies over MAX_UPLOAD_BYTES as they stream in, before they are spooled to disk"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # A declared size over the limit is rejected before any body is read
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > MAX_UPLOAD_BYTES:
+            response = ORJSONResponse(status_code=413, content={"detail": _UPLOAD_TOO_LARGE_DETAIL})
+            await response(scope, receive, send)
+            return
+        
+        # Chunked or mislabelled bodies are counted as they arrive; the
+        # HTTPException surfaces through FastAPI's body parsing as a 413
+        received = 0
+        
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > MAX_UPLOAD_BYTES:
+                    raise HTTPException(status_code=413, detail=_UPLOAD_TOO_LARGE_DETAIL)
+            return message
+        
+        await self.app(scope, limited_receive, send)
+
+app.add_middleware(MaxBodySizeMiddleware)
+
+# Add CORS middleware (added last so it wraps every other middleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://localhost:3001", "http://127.0.0.1:3000", "http://127.0.0.1:3001"],  # React dev server
@@ -70,14 +122,22 @@ app.add_middleware(
 # Security
 security = HTTPBearer()
 
-# Initialize transcription service
-transcription_service = TranscriptionService()
-
 # Ensure uploads directory exists
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
 
-ALLOWED_AUDIO_TYPES = {
+# Uploads are streamed to disk in 1 MiB chunks
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Largest accepted upload; enforced as the body streams in and while writing to disk
+MAX_UPLOAD_BYTES = 500 * 1024 * 1024
+_UPLOAD_TOO_LARGE_DETAIL = f"File too large. Maximum upload size is {MAX_UPLOAD_BYTES // (1024 * 1024)} MB"
+_CAN_SENDFILE = sys.platform.startswith("linux")
+
+# Number of transcript characters included in recording list items
+TRANSCRIPT_PREVIEW_LENGTH = 150
+
+ALLOWED_AUDIO_TYPES = frozenset({
     "audio/mpeg",       # .mp3
     "audio/mp4",        # .m4a
     "audio/m4a",        # .m4a (alternative MIME type)
@@ -86,18 +146,76 @@ ALLOWED_AUDIO_TYPES = {
     "audio/x-wav",      # .wav
     "audio/aac",        # .aac
     "video/mp4"         # .mp4 (audio from video)
-}
+})
+_ALLOWED_AUDIO_TYPES_STR = ", ".join(sorted(ALLOWED_AUDIO_TYPES))
+
+# Hot-path statements; lambda_stmt caches the construct and its compiled SQL,
+# so per-request cost is just binding the parameters
+USER_BY_EMAIL = lambda_stmt(lambda: select(User).where(User.email == bindparam("email")))
+
+RECORDING_COUNT_BY_USER = lambda_stmt(
+    lambda: select(func.count(Recording.id)).where(Recording.user_id == bindparam("user_id"))
+)
+
+# Only the list columns, so transcript/summary blobs never leave the database
+RECORDING_PAGE_BY_USER = lambda_stmt(
+    lambda: select(
+        Recording.id,
+        Recording.title,
+        Recording.filename,
+        Recording.file_size,
+        Recording.duration,
+        Recording.file_type,
+        Recording.status,
+        Recording.created_at,
+        func.substr(Recording.transcript, 1, bindparam("preview_length")).label("transcript_preview")
+    ).where(
+        Recording.user_id == bindparam("user_id")
+    ).order_by(Recording.id).offset(bindparam("skip")).limit(bindparam("limit"))
+)
+
+# (user_id, expiry) of verified tokens keyed by token digest, so repeat requests
+# skip JWT verification. Raw tokens are never stored.
+_token_cache = TTLCache(maxsize=10000, ttl=60)
+_revoked_tokens = TTLCache(maxsize=10000, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+_token_cache_lock = threading.Lock()
+
+def _token_digest(token: str) -> bytes:
+    """Hash a token for use as a cache key"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
 
 # Dependency to get current user
-async def get_current_user(
+# Handlers that touch the database are plain `def` so FastAPI runs them in its
+# threadpool instead of blocking the event loop on synchronous SQLAlchemy calls
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ):
     """Get current authenticated user"""
     token = credentials.credentials
-    user_id = verify_token(token)
+    digest = _token_digest(token)
+    
+    with _token_cache_lock:
+        revoked = digest in _revoked_tokens
+        cached = _token_cache.get(digest)
+    
+    if revoked:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    if cached is not None and cached[1] > time.time():
+        user_id = cached[0]
+    else:
+        user_id = int(verify_token(token))
+        expires_at = jwt.get_unverified_claims(token)["exp"]
+        with _token_cache_lock:
+            _token_cache[digest] = (user_id, expires_at)
+    
+    # Loaded per request so deleted users stop authenticating immediately
+    user = db.get(User, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -105,56 +223,40 @@ async def get_current_user(
         )
     return user
 
-# Background task for processing transcription
-def process_transcription(recording_id: int, file_path: str):
-    """Background task to process audio transcription and create summary"""
-    db = next(get_db())
-    
+def _sendfile_upload(src, file_path: Path) -> int:
+    """Copy a disk-backed upload to file_path inside the kernel, returning bytes written"""
+    src_fd = src.fileno()
+    size = os.fstat(src_fd).st_size
+    dst_fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
     try:
-        # Update recording status
-        recording = db.query(Recording).filter(Recording.id == recording_id).first()
-        if not recording:
-            return
-        
-        recording.status = "processing"
-        db.commit()
-        
-        # Transcribe audio
-        result = transcription_service.transcribe_audio(file_path)
-        
-        # Update recording with transcript
-        recording.transcript = result["transcript"]
-        recording.duration = result.get("audio_duration", 0) / 1000  # Convert to seconds
-        recording.status = "transcribed"
-        db.commit()
-        
-        # Extract action items and key points
-        action_items = transcription_service.extract_action_items(result["transcript"])
-        key_points = transcription_service.extract_key_points(result["summary"], result["transcript"])
-        
-        # Create summary
-        summary = Summary(
-            title=f"Summary of {recording.title}",
-            content=result["summary"],
-            action_items=json.dumps(action_items),
-            key_points=json.dumps(key_points),
-            status="completed",
-            recording_id=recording.id
-        )
-        
-        db.add(summary)
-        recording.status = "completed"
-        db.commit()
-        
-    except Exception as e:
-        # Update recording status to error
-        recording = db.query(Recording).filter(Recording.id == recording_id).first()
-        if recording:
-            recording.status = "error"
-            db.commit()
-        print(f"Transcription error: {str(e)}")
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
     finally:
-        db.close()
+        os.close(dst_fd)
+    return offset
+
+async def save_upload(file: UploadFile, file_path: Path) -> int:
+    """Write an uploaded file to disk and return its size in bytes"""
+    # Uploads spooled to a temporary file are copied with sendfile (Linux only);
+    # anything else, including in-memory uploads and file objects we don't
+    # recognise, is streamed in chunks without blocking the event loop
+    if _CAN_SENDFILE and getattr(file.file, "_rolled", False):
+        if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail=_UPLOAD_TOO_LARGE_DETAIL)
+        return await run_in_threadpool(_sendfile_upload, file.file, file_path)
+    
+    file_size = 0
+    async with aiofiles.open(file_path, "wb") as buffer:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > MAX_UPLOAD_BYTES:
+                raise HTTPException(status_code=413, detail=_UPLOAD_TOO_LARGE_DETAIL)
+            await buffer.write(chunk)
+    return file_size
 
 @app.get("/", tags=["General"])
 async def root():
@@ -163,11 +265,10 @@ async def root():
 
 # Authentication endpoints
 @app.post("/register", response_model=UserResponse, tags=["Authentication"])
-async def register(user: UserCreate, db: Session = Depends(get_db)):
+def register(user: UserCreate, db: Session = Depends(get_db)):
     """Register a new user"""
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user.email).first()
-    if existing_user:
+    if db.query(exists().where(User.email == user.email)).scalar():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
@@ -183,21 +284,28 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
     
     db.add(new_user)
     db.commit()
-    db.refresh(new_user)
     
     return new_user
 
 @app.post("/login", response_model=Token, tags=["Authentication"])
-async def login(user: UserLogin, db: Session = Depends(get_db)):
+def login(user: UserLogin, db: Session = Depends(get_db)):
     """Login user and return access token"""
-    db_user = db.query(User).filter(User.email == user.email).first()
+    db_user = db.execute(USER_BY_EMAIL, {"email": user.email}).scalar_one_or_none()
     
-    if not db_user or not verify_password(user.password, db_user.password):
+    verified, new_hash = (
+        verify_and_update_password(user.password, db_user.password) if db_user else (False, None)
+    )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
         )
     
+    # Upgrade legacy bcrypt hashes to argon2 on successful login
+    if new_hash:
+        db_user.password = new_hash
+        db.commit()
+    
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": str(db_user.id)}, expires_delta=access_token_expires
@@ -205,6 +313,19 @@ async def login(user: UserLogin, db: Session = Depends(get_db)):
     
     return {"access_token": access_token, "token_type": "bearer"}
 
+@app.post("/logout", tags=["Authentication"])
+async def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: User = Depends(get_current_user)
+):
+    """Revoke the current access token"""
+    digest = _token_digest(credentials.credentials)
+    with _token_cache_lock:
+        _token_cache.pop(digest, None)
+        _revoked_tokens[digest] = True
+    
+    return {"message": "Logged out successfully"}
+
 @app.get("/me", response_model=UserResponse, tags=["Authentication"])
 async def get_current_user_info(current_user: User = Depends(get_current_user)):
     """Get current user information"""
@@ -224,7 +345,7 @@ async def upload_recording(
     if file.content_type not in ALLOWED_AUDIO_TYPES:
         raise HTTPException(
             status_code=400,
-            detail=f"File type {file.content_type} not supported. Supported types: {list(ALLOWED_AUDIO_TYPES)}"
+            detail=f"File type {file.content_type} not supported. Supported types: {_ALLOWED_AUDIO_TYPES_STR}"
         )
     
     # Generate unique filename
@@ -235,11 +356,7 @@ async def upload_recording(
     
     try:
         # Save file to disk
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
-        # Get file info
-        file_size = os.path.getsize(file_path)
+        file_size = await save_upload(file, file_path)
         file_type = file_extension.lstrip('.')
         
         # Create database record
@@ -255,7 +372,6 @@ async def upload_recording(
         
         db.add(recording)
         db.commit()
-        db.refresh(recording)
         
         # Note: Auto-processing disabled to save AssemblyAI credits
         # Use POST /recordings/{id}/process or /recordings/{id}/process-now to start processing
@@ -270,6 +386,11 @@ async def upload_recording(
             "next_step": f"POST /recordings/{recording.id}/process-now"
         }
         
+    except HTTPException:
+        # Clean up partially written file before rejecting the upload
+        if file_path.exists():
+            os.remove(file_path)
+        raise
     except Exception as e:
         # Clean up file if database operation fails
         if file_path.exists():
@@ -277,48 +398,55 @@ async def upload_recording(
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 @app.get("/recordings/", response_model=RecordingList, tags=["Recordings"])
-async def get_my_recordings(
+def get_my_recordings(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all recordings for the authenticated user"""
-    recordings = db.query(Recording).filter(Recording.user_id == current_user.id).all()
-    return {"recordings": recordings, "total": len(recordings)}
+    """Get a page of recordings for the authenticated user"""
+    total = db.execute(RECORDING_COUNT_BY_USER, {"user_id": current_user.id}).scalar()
+    recordings = db.execute(
+        RECORDING_PAGE_BY_USER,
+        {
+            "user_id": current_user.id,
+            "skip": skip,
+            "limit": limit,
+            "preview_length": TRANSCRIPT_PREVIEW_LENGTH
+        }
+    ).all()
+    return {"recordings": recordings, "total": total, "skip": skip, "limit": limit}
 
 @app.get("/recordings/{recording_id}", response_model=RecordingResponse, tags=["Recordings"])
-async def get_recording(
+def get_recording(
     recording_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get a specific recording (only if it belongs to the user)"""
-    recording = db.query(Recording).filter(
-        Recording.id == recording_id,
-        Recording.user_id == current_user.id
-    ).first()
+    recording = db.get(Recording, recording_id)
     
-    if not recording:
+    if recording is None or recording.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Recording not found")
     return recording
 
 @app.delete("/recordings/{recording_id}", tags=["Recordings"])
-async def delete_recording(
+def delete_recording(
     recording_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Delete a recording (only if it belongs to the user)"""
-    recording = db.query(Recording).filter(
-        Recording.id == recording_id,
-        Recording.user_id == current_user.id
-    ).first()
+    recording = db.get(Recording, recording_id)
     
-    if not recording:
+    if recording is None or recording.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Recording not found")
     
-    # Delete file from disk
-    if os.path.exists(recording.file_path):
+    # Delete file from disk (this handler already runs in the threadpool)
+    try:
         os.remove(recording.file_path)
+    except FileNotFoundError:
+        pass
     
     # Delete from database
     db.delete(recording)
@@ -328,42 +456,47 @@ async def delete_recording(
 
 # Processing endpoints
 @app.post("/recordings/{recording_id}/process", tags=["Processing"])
-async def process_recording_manually(
+def process_recording_manually(
     recording_id: int,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Manually trigger processing for a recording"""
-    recording = db.query(Recording).filter(
-        Recording.id == recording_id,
-        Recording.user_id == current_user.id
-    ).first()
+    recording = db.get(Recording, recording_id)
     
-    if not recording:
+    if recording is None or recording.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Recording not found")
     
     if recording.status in ["processing", "completed"]:
         return {"message": f"Recording is already {recording.status}"}
     
-    # Add background task for transcription
-    background_tasks.add_task(process_transcription, recording.id, recording.file_path)
+    # Queue transcription on a Celery worker; the worker marks the recording as
+    # processing when it picks the task up, so a task that is never consumed
+    # doesn't leave the recording stuck and it can be queued again
+    try:
+        task = transcribe_task.delay(recording.id)
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Could not queue processing: {str(e)}")
     
-    return {"message": "Processing started", "recording_id": recording.id, "status": "processing"}
+    return {
+        "message": "Processing queued",
+        "recording_id": recording.id,
+        "status": recording.status,
+        "task_id": task.id,
+        "next_step": f"GET /recordings/{recording.id}/status?task_id={task.id}"
+    }
 
 @app.get("/recordings/{recording_id}/status", tags=["Processing"])
-async def get_processing_status(
+def get_processing_status(
     recording_id: int,
+    task_id: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get processing status of a recording"""
-    recording = db.query(Recording).filter(
-        Recording.id == recording_id,
-        Recording.user_id == current_user.id
-    ).first()
+    recording = db.get(Recording, recording_id, options=[joinedload(Recording.summary_obj)])
     
-    if not recording:
+    if recording is None or recording.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Recording not found")
     
     result = {
@@ -377,21 +510,21 @@ async def get_processing_status(
     if recording.summary_obj:
         result["summary_status"] = recording.summary_obj.status
     
+    if task_id:
+        result["task_state"] = celery_app.AsyncResult(task_id).state
+    
     return result
 
 @app.get("/recordings/{recording_id}/summary", response_model=SummaryResponse, tags=["Summaries"])
-async def get_recording_summary(
+def get_recording_summary(
     recording_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get summary for a specific recording (only if it belongs to the user)"""
-    recording = db.query(Recording).filter(
-        Recording.id == recording_id,
-        Recording.user_id == current_user.id
-    ).first()
+    recording = db.get(Recording, recording_id)
     
-    if not recording:
+    if recording is None or recording.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Recording not found")
     
     if not recording.summary_obj:
@@ -404,7 +537,7 @@ async def get_recording_summary(
     return recording.summary_obj
 
 @app.get("/summaries/", tags=["Summaries"])
-async def get_my_summaries(
+def get_my_summaries(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -416,18 +549,15 @@ async def get_my_summaries(
     return {"summaries": summaries, "total": len(summaries)}
 
 @app.post("/recordings/{recording_id}/process-now", tags=["Processing"])
-async def process_recording_now(
+def process_recording_now(
     recording_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Process recording immediately and return results (synchronous)"""
-    recording = db.query(Recording).filter(
-        Recording.id == recording_id,
-        Recording.user_id == current_user.id
-    ).first()
+    recording = db.get(Recording, recording_id)
     
-    if not recording:
+    if recording is None or recording.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Recording not found")
     
     if recording.status == "completed":
@@ -442,34 +572,33 @@ async def process_recording_now(
         recording.status = "processing"
         db.commit()
         
-        # Process transcription
-        result = transcription_service.transcribe_audio(recording.file_path)
+        # Process transcription: the coroutine runs on the event loop while this
+        # threadpool worker (and its database session) waits for the result
+        result = from_thread.run(transcription_service.transcribe_long_audio_async, recording.file_path)
         
-        # Update recording with transcript
+        # Update recording with transcript (committed together with the summary)
         recording.transcript = result["transcript"]
         recording.duration = result.get("audio_duration", 0) / 1000  # Convert to seconds
-        recording.status = "transcribed"
-        db.commit()
         
-        # Extract action items and key points
-        action_items = transcription_service.extract_action_items(result["transcript"])
-        key_points = transcription_service.extract_key_points(result["summary"], result["transcript"])
+        # Action items and key points are extracted by the transcription service
+        action_items = result["action_items"]
+        key_points = result["key_points"]
         
         # Create or update summary
         existing_summary = db.query(Summary).filter(Summary.recording_id == recording.id).first()
         
         if existing_summary:
             existing_summary.content = result["summary"]
-            existing_summary.action_items = json.dumps(action_items)
-            existing_summary.key_points = json.dumps(key_points)
+            existing_summary.action_items = action_items
+            existing_summary.key_points = key_points
             existing_summary.status = "completed"
             summary = existing_summary
         else:
             summary = Summary(
                 title=f"Summary of {recording.title}",
                 content=result["summary"],
-                action_items=json.dumps(action_items),
-                key_points=json.dumps(key_points),
+                action_items=action_items,
+                key_points=key_points,
                 status="completed",
                 recording_id=recording.id
             )
@@ -477,7 +606,6 @@ async def process_recording_now(
         
         recording.status = "completed"
         db.commit()
-        db.refresh(summary)
         
         return {
             "message": "Processing completed successfully",
@@ -485,8 +613,8 @@ async def process_recording_now(
             "transcript": recording.transcript,
             "summary": {
                 "content": summary.content,
-                "action_items": json.loads(summary.action_items) if summary.action_items else [],
-                "key_points": json.loads(summary.key_points) if summary.key_points else []
+                "action_items": summary.action_items or [],
+                "key_points": summary.key_points or []
             },
             "duration": recording.duration,
             "status": recording.status
@@ -0,0 +1,91 @@
+"""
+One-off migration for SQLite databases created before the timestamp columns
+had server defaults (created_at / updated_at DEFAULT CURRENT_TIMESTAMP).
+
+create_all never alters existing tables and SQLite can't add a default to an
+existing column, so each affected table is rebuilt from the current model
+definition, its rows are copied over and NULL timestamps are backfilled.
+
+Stop the API and back up the database file before running:
+    python migrate_timestamps.py
+"""
+from sqlalchemy import inspect
+from sqlalchemy.schema import CreateTable
+
+from database import engine, Base
+import models.users  # noqa: F401 (registers the tables on Base.metadata)
+import models.recordings  # noqa: F401
+import models.summry  # noqa: F401
+
+TIMESTAMP_COLUMNS = ("created_at", "updated_at")
+
+
+def _missing_defaults(connection, table) -> bool:
+    """Whether an existing table has a timestamp column without a DEFAULT"""
+    columns = {
+        row[1]: row[4]  # name -> dflt_value
+        for row in connection.exec_driver_sql(f'PRAGMA table_info("{table.name}")')
+    }
+    return any(name in columns and columns[name] is None for name in TIMESTAMP_COLUMNS if name in table.c)
+
+
+def _rebuild(connection, table):
+    """Recreate table with the model's DDL, keeping its rows and backfilling timestamps"""
+    new_name = f"{table.name}_new"
+    existing = [
+        row[1] for row in connection.exec_driver_sql(f'PRAGMA table_info("{table.name}")')
+    ]
+    columns = ", ".join(f'"{name}"' for name in existing if name in table.c)
+
+    create_sql = str(CreateTable(table).compile(engine)).replace(
+        f"CREATE TABLE {table.name} (", f"CREATE TABLE {new_name} (", 1
+    )
+    connection.exec_driver_sql(create_sql)
+    connection.exec_driver_sql(
+        f'INSERT INTO {new_name} ({columns}) SELECT {columns} FROM "{table.name}"'
+    )
+    for name in TIMESTAMP_COLUMNS:
+        if name in table.c:
+            connection.exec_driver_sql(
+                f"UPDATE {new_name} SET {name} = CURRENT_TIMESTAMP WHERE {name} IS NULL"
+            )
+    connection.exec_driver_sql(f'DROP TABLE "{table.name}"')
+    connection.exec_driver_sql(f"ALTER TABLE {new_name} RENAME TO {table.name}")
+
+    # Dropping the old table dropped its indexes too
+    for index in table.indexes:
+        index.create(bind=connection, checkfirst=True)
+
+
+def migrate():
+    if engine.dialect.name != "sqlite":
+        raise SystemExit("This migration only supports SQLite databases")
+
+    with engine.connect() as connection:
+        # Foreign keys must be off while tables are dropped and renamed, and
+        # the pragma has no effect inside a transaction
+        connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        connection.commit()
+        try:
+            with connection.begin():
+                # pysqlite only opens a transaction before DML; begin explicitly
+                # so the DDL below is rolled back too if anything fails
+                connection.exec_driver_sql("BEGIN")
+                for table in Base.metadata.sorted_tables:
+                    if not inspect(connection).has_table(table.name):
+                        continue
+                    if _missing_defaults(connection, table):
+                        print(f"Rebuilding {table.name}")
+                        _rebuild(connection, table)
+                    else:
+                        print(f"{table.name} is up to date")
+
+                problems = connection.exec_driver_sql("PRAGMA foreign_key_check").fetchall()
+                if problems:
+                    raise RuntimeError(f"Foreign key check failed: {problems}")
+        finally:
+            connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+
+if __name__ == "__main__":
+    migrate()
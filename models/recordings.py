@@ -1,11 +1,14 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float, Text
-from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float, Text, Index, JSON
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.sql import func
 from database import Base
 
 
 class Recording(Base):
     __tablename__ = 'recordings'
+    __table_args__ = (
+        Index('ix_recordings_user_id_id', 'user_id', 'id'),  # user-scoped lookups and listings
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -15,17 +18,17 @@ class Recording(Base):
     duration = Column(Float)  # Duration in seconds
     file_type = Column(String)  # e.g., 'mp3', 'm4a', 'wav'
     
-    # AI-generated content
-    transcript = Column(Text)  # Full transcription
-    summary = Column(Text)  # Meeting summary
-    action_items = Column(Text)  # Extracted action items (JSON string)
+    # AI-generated content (large text columns are loaded on first access)
+    transcript = deferred(Column(Text))  # Full transcription
+    summary = deferred(Column(Text))  # Meeting summary
+    action_items = Column(JSON)  # Extracted action items (list of strings)
     
     # Processing status
     status = Column(String, default='uploaded')  # uploaded, processing, completed, error
     
-    # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Timestamps (databases created before the server defaults need migrate_timestamps.py)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Foreign key
     user_id = Column(Integer, ForeignKey('users.id', ondelete="CASCADE"))
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, JSON
 from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy.sql import func
 from database import Base
 
 
@@ -10,18 +10,18 @@ class Summary(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     content = Column(Text)  # The actual summary text
-    action_items = Column(Text)  # JSON string of action items
-    key_points = Column(Text)  # JSON string of key points
+    action_items = Column(JSON)  # List of action items
+    key_points = Column(JSON)  # List of key points
     
     # Processing status
     status = Column(String, default='pending')  # pending, processing, completed, error
     
-    # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Timestamps (databases created before the server defaults need migrate_timestamps.py)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Foreign key to recording
-    recording_id = Column(Integer, ForeignKey('recordings.id', ondelete="CASCADE"), unique=True)
+    recording_id = Column(Integer, ForeignKey('recordings.id', ondelete="CASCADE"), unique=True, index=True)
     
     # Relationship
     recording = relationship('Recording', back_populates='summary_obj')
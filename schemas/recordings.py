@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 
 
@@ -16,7 +16,7 @@ class RecordingUpdate(BaseModel):
     title: Optional[str] = None
     transcript: Optional[str] = None
     summary: Optional[str] = None
-    action_items: Optional[str] = None
+    action_items: Optional[List[str]] = None
     status: Optional[str] = None
 
 
@@ -29,7 +29,7 @@ class RecordingResponse(BaseModel):
     file_type: Optional[str]
     transcript: Optional[str]
     summary: Optional[str]
-    action_items: Optional[str]
+    action_items: Optional[List[str]]
     status: str
     created_at: datetime
     updated_at: datetime
@@ -39,6 +39,23 @@ class RecordingResponse(BaseModel):
         from_attributes = True
 
 
+class RecordingListItem(BaseModel):
+    id: int
+    title: str
+    filename: str
+    file_size: Optional[int]
+    duration: Optional[float]
+    file_type: Optional[str]
+    status: str
+    created_at: datetime
+    transcript_preview: Optional[str]
+
+    class Config:
+        from_attributes = True
+
+
 class RecordingList(BaseModel):
-    recordings: list[RecordingResponse]
+    recordings: list[RecordingListItem]
     total: int
+    skip: int
+    limit: int
@@ -6,15 +6,15 @@ from datetime import datetime
 class SummaryCreate(BaseModel):
     title: str
     content: Optional[str] = None
-    action_items: Optional[str] = None
-    key_points: Optional[str] = None
+    action_items: Optional[List[str]] = None
+    key_points: Optional[List[str]] = None
 
 
 class SummaryUpdate(BaseModel):
     title: Optional[str] = None
     content: Optional[str] = None
-    action_items: Optional[str] = None
-    key_points: Optional[str] = None
+    action_items: Optional[List[str]] = None
+    key_points: Optional[List[str]] = None
     status: Optional[str] = None
 
 
@@ -22,8 +22,8 @@ class SummaryResponse(BaseModel):
     id: int
     title: str
     content: Optional[str]
-    action_items: Optional[str]
-    key_points: Optional[str]
+    action_items: Optional[List[str]]
+    key_points: Optional[List[str]]
     status: str
     created_at: datetime
     updated_at: datetime
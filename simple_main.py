@@ -1,9 +1,11 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
-import shutil
+from fastapi.concurrency import run_in_threadpool
 import os
 from pathlib import Path
 from datetime import datetime
 
+from file_storage import write_upload
+
 app = FastAPI(title="Voice-to-Text Meeting Assistant", version="1.0.0")
 
 # Ensure uploads directory exists
@@ -47,12 +49,10 @@ async def upload_recording(
     file_path = UPLOAD_DIR / unique_filename
     
     try:
-        # Save file to disk
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Save file to disk in a worker thread so the event loop isn't blocked
+        file_size = await run_in_threadpool(write_upload, file.file, file_path)
         
         # Get file info
-        file_size = os.path.getsize(file_path)
         file_type = file_extension.lstrip('.')
         
         return {
@@ -71,9 +71,8 @@ async def upload_recording(
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 
-@app.get("/files/")
-async def list_uploaded_files():
-    """List all uploaded files"""
+def _scan_uploaded_files():
+    """Collect name, size and creation time of every uploaded file"""
     files = []
     for file_path in UPLOAD_DIR.glob("*"):
         if file_path.is_file():
@@ -83,6 +82,14 @@ async def list_uploaded_files():
                 "size": stat.st_size,
                 "created": datetime.fromtimestamp(stat.st_ctime).isoformat()
             })
+    return files
+
+
+@app.get("/files/")
+async def list_uploaded_files():
+    """List all uploaded files"""
+    # Directory scans and stat() calls block, so run them off the event loop
+    files = await run_in_threadpool(_scan_uploaded_files)
     return {"files": files, "total": len(files)}
 
 
@@ -0,0 +1,71 @@
+from celery import Celery
+from sqlalchemy import insert, update
+import asyncio
+import os
+
+from database import get_db
+from models.users import User  # registers the User mapper for relationships
+from models.recordings import Recording
+from models.summry import Summary
+from transcription_service import transcription_service
+
+# Celery application (run workers with: celery -A tasks worker)
+celery_app = Celery(
+    "voiceai",
+    broker=os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0"),
+    backend=os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0"),
+)
+
+# No task-level retries: the transcription service already retries each
+# AssemblyAI request, and retrying the task would submit (and pay for) new jobs
+@celery_app.task
+def transcribe_task(recording_id: int):
+    """Celery task to process audio transcription and create summary"""
+    db = next(get_db())
+
+    try:
+        # Update recording status
+        recording = db.get(Recording, recording_id)
+        if not recording:
+            return
+
+        recording.status = "processing"
+        db.commit()
+
+        # Transcribe audio; long recordings are split and their segments transcribed in parallel
+        result = asyncio.run(transcription_service.transcribe_long_audio_async(recording.file_path))
+
+        # Action items and key points are extracted by the transcription service
+        action_items = result["action_items"]
+        key_points = result["key_points"]
+
+        # Create summary and update recording with bulk statements, skipping
+        # unit-of-work bookkeeping; both are committed together
+        db.execute(insert(Summary), [{
+            "title": f"Summary of {recording.title}",
+            "content": result["summary"],
+            "action_items": action_items,
+            "key_points": key_points,
+            "status": "completed",
+            "recording_id": recording.id
+        }])
+        db.execute(update(Recording), [{
+            "id": recording.id,
+            "transcript": result["transcript"],
+            "duration": result.get("audio_duration", 0) / 1000,  # Convert to seconds
+            "status": "completed"
+        }])
+        db.commit()
+
+    except Exception as e:
+        db.rollback()
+        print(f"Transcription error: {str(e)}")
+
+        # Update recording status to error
+        recording = db.get(Recording, recording_id)
+        if recording:
+            recording.status = "error"
+            db.commit()
+        raise
+    finally:
+        db.close()
@@ -1,125 +1,137 @@
-import requests
-import json
+import asyncio
+import httpx
+import orjson
 
 # Test API endpoints
 BASE_URL = "http://localhost:8001"
 
-def test_upload():
-    print("🧪 Testing File Upload...")
-    
-    # First login to get token
-    login_data = {
-        "email": "test@example.com",
-        "password": "testpass123"
-    }
-    
-    try:
-        response = requests.post(f"{BASE_URL}/login", json=login_data)
-        if response.status_code != 200:
-            print("❌ Login failed, cannot test upload")
-            return
-            
-        token = response.json().get("access_token")
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        # Test upload with a dummy text file (simulating audio)
-        files = {
-            'file': ('test_audio.txt', 'This is a test audio file content', 'text/plain')
-        }
-        data = {
-            'title': 'Test Recording Upload'
-        }
-        
-        response = requests.post(f"{BASE_URL}/upload-recording/", 
-                               headers=headers, 
-                               files=files, 
-                               data=data)
-        
-        print(f"Upload response: {response.status_code}")
-        if response.status_code == 200:
-            print("✅ File upload successful!")
-            print(f"Response: {response.json()}")
-        else:
-            print(f"❌ Upload failed: {response.text}")
-            
-    except Exception as e:
-        print(f"❌ Upload test error: {e}")
+TEST_USER = {
+    "name": "Test User",
+    "email": "test@example.com",
+    "password": "testpass123"
+}
 
-def test_api():
-    print("🧪 Testing Voice-to-Text API...")
-    
-    # Test 1: Check if server is running
-    try:
-        response = requests.get(f"{BASE_URL}/docs")
-        print("✅ Server is running - API docs accessible")
-    except requests.exceptions.ConnectionError:
-        print("❌ Server is not running")
-        return
-    
-    # Test 2: Register a new user
-    test_user = {
-        "name": "Test User",
-        "email": "test@example.com",
-        "password": "testpass123"
-    }
-    
+def create_client():
+    """Create an async client that keeps connections to the API alive between calls"""
+    # Limits go on the transport; httpx ignores client-level limits when a transport is given
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        transport=httpx.AsyncHTTPTransport(
+            retries=3,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        ),
+        timeout=30
+    )
+
+async def _post_json(client, path, obj):
+    """POST obj as a JSON body encoded straight to bytes by orjson"""
+    return await client.post(path, content=orjson.dumps(obj), headers={"Content-Type": "application/json"})
+
+async def register_and_login(client):
+    """Register the test user and store its token on the client; False if the server is down"""
+    # Test 1: Register a new user
     try:
-        response = requests.post(f"{BASE_URL}/register", json=test_user)
+        response = await _post_json(client, "/register", TEST_USER)
         if response.status_code in [200, 201]:
             print("✅ User registration successful")
-            user_data = response.json()
+            user_data = orjson.loads(response.content)
             print(f"   User ID: {user_data.get('id')}")
         elif response.status_code == 400 and "already registered" in response.text:
             print("ℹ️  User already exists (expected)")
         else:
             print(f"❌ Registration failed: {response.status_code} - {response.text}")
+    except httpx.ConnectError:
+        print("❌ Server is not running")
+        return False
     except Exception as e:
         print(f"❌ Registration error: {e}")
-    
-    # Test 3: Login
+
+    # Test 2: Login
     try:
         login_data = {
-            "email": "test@example.com",
-            "password": "testpass123"
+            "email": TEST_USER["email"],
+            "password": TEST_USER["password"]
         }
-        response = requests.post(f"{BASE_URL}/login", json=login_data)
+        response = await _post_json(client, "/login", login_data)
         if response.status_code == 200:
             print("✅ User login successful")
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
             access_token = token_data.get("access_token")
             print(f"   Token: {access_token[:20]}...")
-            
-            # Test 4: Get user info with token
-            headers = {"Authorization": f"Bearer {access_token}"}
-            response = requests.get(f"{BASE_URL}/me", headers=headers)
-            if response.status_code == 200:
-                print("✅ Authenticated request successful")
-                user_info = response.json()
-                print(f"   User: {user_info.get('email')}")
-            else:
-                print(f"❌ Authenticated request failed: {response.status_code}")
+
+            # Authenticate every following request on this client
+            client.headers["Authorization"] = f"Bearer {access_token}"
         else:
             print(f"❌ Login failed: {response.status_code} - {response.text}")
     except Exception as e:
         print(f"❌ Login error: {e}")
-    
-    # Test 5: Check CORS headers
+
+    return True
+
+async def check_docs(client):
+    """Check that the API docs are served"""
+    try:
+        response = await client.get("/docs")
+        return "API docs", response.status_code == 200, f"status {response.status_code}"
+    except Exception as e:
+        return "API docs", False, str(e)
+
+async def check_me(client):
+    """Check an authenticated request with the client token"""
+    try:
+        response = await client.get("/me")
+        if response.status_code == 200:
+            return "Authenticated request", True, f"user {orjson.loads(response.content).get('email')}"
+        return "Authenticated request", False, f"status {response.status_code}"
+    except Exception as e:
+        return "Authenticated request", False, str(e)
+
+async def check_cors(client):
+    """Check the CORS preflight for the frontend origin"""
     try:
-        response = requests.options(f"{BASE_URL}/register", headers={
+        response = await client.options("/register", headers={
             "Origin": "http://localhost:3001",
             "Access-Control-Request-Method": "POST",
             "Access-Control-Request-Headers": "Content-Type"
         })
-        print(f"🔍 CORS preflight response: {response.status_code}")
+        return "CORS preflight", response.status_code == 200, f"status {response.status_code}"
+    except Exception as e:
+        return "CORS preflight", False, str(e)
+
+async def check_upload(client):
+    """Check file upload with a dummy text file (simulating audio)"""
+    try:
+        files = {
+            'file': ('test_audio.txt', 'This is a test audio file content', 'text/plain')
+        }
+        data = {
+            'title': 'Test Recording Upload'
+        }
+
+        response = await client.post("/upload-recording/", files=files, data=data)
+
         if response.status_code == 200:
-            print("✅ CORS is properly configured")
-        else:
-            print("❌ CORS configuration may have issues")
+            return "File upload", True, f"response {orjson.loads(response.content)}"
+        return "File upload", False, f"{response.status_code} - {response.text}"
     except Exception as e:
-        print(f"❌ CORS test error: {e}")
-    
-    # Test 6: File upload
-    test_upload()
+        return "File upload", False, str(e)
+
+async def test_api(client):
+    print("🧪 Testing Voice-to-Text API...")
+
+    # Register and login run first since the remaining checks need the token
+    if not await register_and_login(client):
+        return
+
+    # The remaining checks are independent, so run them concurrently
+    checks = [check_docs(client), check_cors(client), check_me(client), check_upload(client)]
+    for next_result in asyncio.as_completed(checks):
+        name, ok, detail = await next_result
+        print(f"{'✅' if ok else '❌'} {name}: {detail}")
+
+async def main():
+    async with create_client() as client:
+        await test_api(client)
 
 if __name__ == "__main__":
-    test_api()
+    asyncio.run(main())
@@ -1,24 +1,298 @@
+import ahocorasick
 import assemblyai as aai
-import json
-from typing import Dict, Any
+import asyncio
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import hashlib
+import httpx
+import orjson
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional
 import os
 import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
-# Set your AssemblyAI API key
-aai.settings.api_key = os.getenv("ASSEMBLYAI_API_KEY")
+# Set your AssemblyAI API key once; dev reloaders re-import this module and
+# should not reset the SDK's global settings
+if not aai.settings.api_key:
+    aai.settings.api_key = os.getenv("ASSEMBLYAI_API_KEY")
 if not aai.settings.api_key:
     raise RuntimeError("ASSEMBLYAI_API_KEY environment variable not set")
+
+
+class TranscriptionError(RuntimeError):
+    """Transcription failed and retrying will not help"""
+
+
+class TranscriptionRetryable(TranscriptionError):
+    """Transcription failed for a transient reason (network, rate limit, server error)"""
+
+
+def _service_error(e: Exception) -> TranscriptionError:
+    """Classify an unexpected failure as retryable or permanent"""
+    message = f"Transcription service error: {str(e)}"
+    if isinstance(e, httpx.TransportError):
+        return TranscriptionRetryable(message)
+    
+    # Failed API requests are classified by their HTTP status; the SDK records
+    # it on AssemblyAIError. Errors without a status are treated as permanent.
+    status_code = None
+    if isinstance(e, httpx.HTTPStatusError):
+        status_code = e.response.status_code
+    elif isinstance(e, aai.AssemblyAIError):
+        status_code = e.status_code
+    if status_code is not None and (status_code == 429 or status_code >= 500):
+        return TranscriptionRetryable(message)
+    return TranscriptionError(message)
+
+
+# Retry transient failures with exponential backoff (1s, 2s, 4s, ... capped at 30s).
+# Applied to single API requests only, never to a whole transcription, so a
+# failure after submission can't submit (and pay for) a second job.
+_retry_transient = retry(
+    retry=retry_if_exception_type(TranscriptionRetryable),
+    wait=wait_exponential(multiplier=1, min=1, max=30),
+    stop=stop_after_attempt(4),
+    reraise=True
+)
+
+# Audio files are hashed 1 MiB at a time
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Seconds to wait between status polls of a submitted transcript; the last value repeats
+_POLL_INTERVALS = (1, 2, 5, 10, 30)
+
+
+class _TokenBucket:
+    """Thread- and task-safe token bucket for client-side API rate limiting"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+    
+    def acquire(self):
+        """Block the calling thread until a request may be sent"""
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a request may be sent"""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+
+# Recordings longer than this are split into segments of this many seconds
+# and the segments are transcribed in parallel
+_SEGMENT_SECONDS = 300
+
+# Uploads to AssemblyAI can take minutes, so they get their own threads instead
+# of tying up the default executor used for file hashing and aiofiles writes
+_upload_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("TRANSCRIPTION_UPLOAD_WORKERS", "8")),
+    thread_name_prefix="assemblyai-upload"
+)
+
+# AssemblyAI allows 20,000 requests per 5 minutes (~66/s); stay below it
+_api_limiter = _TokenBucket(rate=60, capacity=60)
+
+
+@_retry_transient
+async def _get_transcript(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    """Fetch a transcript's status, retrying network and server errors"""
+    await _api_limiter.acquire_async()
+    try:
+        response = await client.get(url)
+        if response.status_code >= 500:
+            response.raise_for_status()
+    except httpx.HTTPError as e:
+        raise _service_error(e) from e
+    return response
+
+
+def _file_digest(file_path: str) -> str:
+    """Content hash of a file, used as the transcript cache key"""
+    # Hash in fixed-size chunks through one reused buffer so memory use
+    # stays flat regardless of the audio file size
+    digest = hashlib.blake2b(digest_size=16)
+    buffer = bytearray(_HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as f:
+        while n := f.readinto(buffer):
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+
+async def _probe_duration(file_path: str) -> Optional[float]:
+    """Audio duration in seconds from ffprobe, or None if it can't be read"""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "ffprobe", "-v", "error", "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1", file_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+    except FileNotFoundError:
+        return None
+    stdout, _ = await process.communicate()
+    try:
+        return float(stdout)
+    except ValueError:
+        return None
+
+
+async def _split_audio(file_path: str, output_dir: str, segment_seconds: int) -> Optional[List[tuple]]:
+    """
+    Split the first audio stream of a file into segments with ffmpeg,
+    without re-encoding (video and other streams are dropped)
+    
+    Returns (segment_path, start_seconds) pairs in order, or None if
+    ffmpeg is unavailable or fails
+    """
+    pattern = os.path.join(output_dir, f"segment_%03d{Path(file_path).suffix}")
+    segment_list = os.path.join(output_dir, "segments.csv")
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-v", "error", "-i", file_path, "-map", "0:a:0",
+            "-f", "segment", "-segment_time", str(segment_seconds),
+            "-segment_list", segment_list, "-segment_list_type", "csv",
+            "-c", "copy", pattern,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+    except FileNotFoundError:
+        return None
+    if await process.wait() != 0:
+        return None
+    
+    # Each row is: segment file name, start time, end time (seconds)
+    with open(segment_list, newline="") as f:
+        return [(os.path.join(output_dir, row[0]), float(row[1])) for row in csv.reader(f) if row]
+
+
+# Sentence delimiters are mapped to "." so splitting is a single C-level
+# str.translate + str.split pass instead of a regex split
+_SENTENCE_TABLE = str.maketrans({"!": ".", "?": "."})
+_POINT_TABLE = str.maketrans({"!": ".", "?": ".", ";": "."})
+
+
+def _split_sentences(text: str, table: Dict[int, str] = _SENTENCE_TABLE) -> List[str]:
+    """Split text on the delimiters in table into stripped, non-empty sentences"""
+    return [sentence for sentence in (part.strip() for part in text.translate(table).split(".")) if sentence]
+
+
+# Sentence boundaries for lazy, early-exit scans
+_SENTENCE_BOUNDARY = re.compile(r'[.!?]+')
+
+
+def _iter_sentences(text: str) -> Iterator[str]:
+    """Yield stripped, non-empty sentences one at a time without splitting the whole text"""
+    start = 0
+    for match in _SENTENCE_BOUNDARY.finditer(text):
+        sentence = text[start:match.start()].strip()
+        if sentence:
+            yield sentence
+        start = match.end()
+    sentence = text[start:].strip()
+    if sentence:
+        yield sentence
+
+# Layout version of transcript cache entries. Entries hold only the raw
+# AssemblyAI fields; the summary, action items and key points are derived on
+# every read, so extraction changes apply to cached audio too. Bump this when
+# the raw layout changes.
+_CACHE_VERSION = 2
+
+# Transcript text stored when AssemblyAI returns no text
+_NO_TRANSCRIPT = "No transcript available"
+
+# Longest excerpt of a sentence quoted in a simple summary
+_SUMMARY_PART_LENGTH = 200
+
+# Phrases that mark a sentence as an action item
+_ACTION_KEYWORDS = (
+    "need to", "should", "must", "have to", "will",
+    "action", "todo", "to do", "follow up", "next step",
+    "assign", "responsible", "deadline", "schedule",
+    "contact", "email", "call", "meeting", "send",
+    "remember", "don't forget", "make sure"
+)
+# Aho-Corasick automaton over the keywords: one C-level pass over lowercased
+# text finds every keyword hit regardless of how many keywords there are
+_ACTION_AUTOMATON = ahocorasick.Automaton()
+for _keyword in _ACTION_KEYWORDS:
+    _ACTION_AUTOMATON.add_word(_keyword, _keyword)
+_ACTION_AUTOMATON.make_automaton()
+
+
+def _has_action_keyword(sentence: str) -> bool:
+    """Whether sentence contains any action keyword, case-insensitively"""
+    return next(_ACTION_AUTOMATON.iter(sentence.lower()), None) is not None
+
+
+def _iter_action_sentences(text: str) -> Iterator[str]:
+    """Yield, in order, the stripped sentences of text that contain an action keyword"""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Lowercasing shifted offsets, so hits can't be mapped back to text
+        yield from (sentence for sentence in _iter_sentences(text) if _has_action_keyword(sentence))
+        return
+    
+    # Keywords never contain a boundary, so each hit falls between two
+    # boundaries; bisecting the boundary starts gives its sentence
+    boundaries = [match.span() for match in _SENTENCE_BOUNDARY.finditer(text)]
+    starts = [start for start, _ in boundaries]
+    previous = -1
+    for end_index, _ in _ACTION_AUTOMATON.iter(lowered):
+        index = bisect_right(starts, end_index)
+        if index == previous:
+            continue
+        previous = index
+        sentence_start = boundaries[index - 1][1] if index else 0
+        sentence_end = starts[index] if index < len(starts) else len(text)
+        yield text[sentence_start:sentence_end].strip()
+
+
+@lru_cache(maxsize=1)
+def _transcription_config() -> aai.TranscriptionConfig:
+    """Build the transcription config once and share it between service instances"""
+    # Simplified config for better reliability
+    return aai.TranscriptionConfig(
+        speech_model=aai.SpeechModel.best,
+        punctuate=True,
+        format_text=True,
+        # Remove summary features that might not work for short clips
+    )
+
+
 class TranscriptionService:
     """Service for handling audio transcription using AssemblyAI"""
     
     def __init__(self):
-        # Simplified config for better reliability
-        self.config = aai.TranscriptionConfig(
-            speech_model=aai.SpeechModel.best,
-            punctuate=True,
-            format_text=True,
-            # Remove summary features that might not work for short clips
-        )
+        self.config = _transcription_config()
+        # One transcriber reused for every file keeps the SDK's HTTP connection pool warm
+        self.transcriber = aai.Transcriber(config=self.config)
+        # Raw transcripts are cached by audio content hash so re-processing a file is free
+        self.cache_dir = Path(os.getenv("TRANSCRIPT_CACHE_DIR", "transcript_cache"))
+        self.cache_dir.mkdir(exist_ok=True)
     
     def transcribe_audio(self, file_path: str) -> Dict[str, Any]:
         """
@@ -29,38 +303,32 @@ class TranscriptionService:
             
         Returns:
             Dictionary containing transcript, summary, and other data
+            
+        Raises:
+            FileNotFoundError: The audio file does not exist
+            TranscriptionRetryable: A transient API failure persisted through retries
+            TranscriptionError: Transcription failed permanently
         """
         try:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"Audio file not found: {file_path}")
             
-            # Start transcription
-            transcriber = aai.Transcriber(config=self.config)
-            transcript = transcriber.transcribe(file_path)
+            cache_key = _file_digest(file_path)
+            cached = self._load_cached_result(cache_key)
+            if cached is not None:
+                return self._build_result(cached)
             
-            if transcript.status == "error":
-                raise RuntimeError(f"Transcription failed: {transcript.error}")
-            
-            # Create our own summary if AssemblyAI doesn't provide one
-            transcript_text = transcript.text or "No transcript available"
-            ai_summary = getattr(transcript, 'summary', None)
+            # Upload, submit and wait; each step retries on its own, so a
+            # polling failure never re-submits the job
+            transcript = self._wait_for_completion(self._submit(self._upload(file_path)))
             
-            # If no AI summary, create a simple one
-            if not ai_summary:
-                ai_summary = self.create_simple_summary(transcript_text)
+            if transcript.status == "error":
+                raise TranscriptionError(f"Transcription failed: {transcript.error}")
             
             # Extract key information
-            result = {
-                "transcript": transcript_text,
-                "summary": ai_summary,
-                "chapters": [],
-                "confidence": getattr(transcript, 'confidence', 0.0),
-                "audio_duration": getattr(transcript, 'audio_duration', 0)
-            }
-            
-            # Add chapters if available
+            chapters = []
             if hasattr(transcript, 'chapters') and transcript.chapters:
-                result["chapters"] = [
+                chapters = [
                     {
                         "headline": chapter.headline,
                         "summary": chapter.summary,
@@ -70,66 +338,353 @@ class TranscriptionService:
                     for chapter in transcript.chapters
                 ]
             
-            return result
+            raw = {
+                "text": transcript.text,
+                "summary": getattr(transcript, 'summary', None),
+                "chapters": chapters,
+                "confidence": getattr(transcript, 'confidence', 0.0),
+                "audio_duration": getattr(transcript, 'audio_duration', 0)
+            }
+            
+            self._store_cached_result(cache_key, raw)
+            return self._build_result(raw)
+            
+        except (FileNotFoundError, TranscriptionError):
+            raise
+        except Exception as e:
+            raise _service_error(e) from e
+    
+    async def transcribe_audio_async(self, file_path: str) -> Dict[str, Any]:
+        """
+        Transcribe audio file without holding a thread for the whole job
+        
+        The file is uploaded and submitted once, then the transcript status is
+        polled with backoff, so many jobs can be in flight on one event loop.
+        
+        Args:
+            file_path: Path to the audio file
+            
+        Returns:
+            Dictionary containing transcript, summary, and other data
+            (same shape as transcribe_audio)
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Audio file not found: {file_path}")
+        
+        cache_key = await asyncio.to_thread(_file_digest, file_path)
+        cached = self._load_cached_result(cache_key)
+        if cached is not None:
+            return self._build_result(cached)
+        
+        raw = await self._transcribe_raw_async(file_path)
+        
+        self._store_cached_result(cache_key, raw)
+        return self._build_result(raw)
+    
+    async def _transcribe_raw_async(self, file_path: str) -> Dict[str, Any]:
+        """
+        Upload, submit and poll one file, returning the raw AssemblyAI fields
+        without touching the transcript cache
+        """
+        try:
+            # Upload and submit on the upload pool since the SDK calls block for
+            # as long as the upload takes
+            loop = asyncio.get_running_loop()
+            audio_url = await loop.run_in_executor(_upload_executor, self._upload, file_path)
+            submitted = await loop.run_in_executor(_upload_executor, self._submit, audio_url)
+            
+            data = await self._poll_transcript(submitted.id)
+            
+            if data["status"] == "error":
+                raise TranscriptionError(f"Transcription failed: {data.get('error')}")
+            
+            return {
+                "text": data.get("text"),
+                "summary": data.get("summary"),
+                "chapters": [
+                    {
+                        "headline": chapter["headline"],
+                        "summary": chapter["summary"],
+                        "start": chapter["start"],
+                        "end": chapter["end"]
+                    }
+                    for chapter in data.get("chapters") or []
+                ],
+                "confidence": data.get("confidence") or 0.0,
+                "audio_duration": data.get("audio_duration") or 0
+            }
             
+        except TranscriptionError:
+            raise
+        except Exception as e:
+            raise _service_error(e) from e
+    
+    async def transcribe_long_audio_async(
+        self, file_path: str, segment_seconds: int = _SEGMENT_SECONDS, max_concurrency: int = 8
+    ) -> Dict[str, Any]:
+        """
+        Transcribe audio file, splitting long recordings into segments that
+        are transcribed in parallel and stitched back together
+        
+        Recordings no longer than one segment, or any recording when ffmpeg
+        is not installed, go through transcribe_audio_async unchanged.
+        
+        Args:
+            file_path: Path to the audio file
+            segment_seconds: Length of each segment in seconds
+            max_concurrency: Maximum number of segments in flight at once
+            
+        Returns:
+            Dictionary containing transcript, summary, and other data
+            (same shape as transcribe_audio)
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Audio file not found: {file_path}")
+        
+        duration = await _probe_duration(file_path)
+        if duration is None or duration <= segment_seconds:
+            return await self.transcribe_audio_async(file_path)
+        
+        cache_key = await asyncio.to_thread(_file_digest, file_path)
+        cached = self._load_cached_result(cache_key)
+        if cached is not None:
+            return self._build_result(cached)
+        
+        with tempfile.TemporaryDirectory() as segment_dir:
+            segments = await _split_audio(file_path, segment_dir, segment_seconds)
+            if not segments:
+                return await self.transcribe_audio_async(file_path)
+            
+            # Segments are temporary files, so they skip the transcript cache
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def transcribe_segment(segment_path: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._transcribe_raw_async(segment_path)
+            
+            # Wait for every segment before the directory is removed
+            results = await asyncio.gather(
+                *(transcribe_segment(segment_path) for segment_path, _ in segments),
+                return_exceptions=True
+            )
+        
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        
+        # Stitch segments in order; chapter times are in milliseconds from the
+        # start of their segment, so shift them by the segment offset
+        texts = []
+        chapters = []
+        weighted_confidence = 0.0
+        audio_duration = 0
+        for (_, start), result in zip(segments, results):
+            if result["text"]:
+                texts.append(result["text"])
+            offset = round(start * 1000)
+            for chapter in result["chapters"]:
+                chapters.append({**chapter, "start": chapter["start"] + offset, "end": chapter["end"] + offset})
+            weighted_confidence += (result["confidence"] or 0.0) * (result["audio_duration"] or 0)
+            audio_duration += result["audio_duration"] or 0
+        
+        raw = {
+            "text": " ".join(texts),
+            "summary": None,
+            "chapters": chapters,
+            "confidence": weighted_confidence / audio_duration if audio_duration else 0.0,
+            "audio_duration": audio_duration
+        }
+        
+        self._store_cached_result(cache_key, raw)
+        return self._build_result(raw)
+    
+    async def transcribe_batch(self, file_paths: List[str], max_concurrency: int = 8) -> List[Any]:
+        """
+        Transcribe several audio files concurrently
+        
+        Args:
+            file_paths: Paths to the audio files
+            max_concurrency: Maximum number of transcriptions in flight at once
+            
+        Returns:
+            One entry per file, in order: the result dictionary, or the
+            exception raised for that file
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def transcribe_one(file_path: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.transcribe_audio_async(file_path)
+        
+        return await asyncio.gather(
+            *(transcribe_one(file_path) for file_path in file_paths),
+            return_exceptions=True
+        )
+    
+    @_retry_transient
+    def _upload(self, file_path: str) -> str:
+        """Upload a local audio file to AssemblyAI and return its upload URL"""
+        _api_limiter.acquire()
+        try:
+            return self.transcriber.upload_file(file_path)
         except Exception as e:
-            raise RuntimeError(f"Transcription service error: {str(e)}")
+            raise _service_error(e) from e
     
-    def create_simple_summary(self, transcript_text: str) -> str:
+    @_retry_transient
+    def _submit(self, audio_url: str) -> aai.Transcript:
+        """Start transcribing an uploaded file without waiting for the result"""
+        _api_limiter.acquire()
+        try:
+            submitted = self.transcriber.submit(audio_url)
+        except Exception as e:
+            raise _service_error(e) from e
+        
+        # A failed submission has no id to poll; keep the SDK's error message
+        if submitted.status == aai.TranscriptStatus.error or submitted.id is None:
+            raise TranscriptionError(f"Transcription failed: {submitted.error}")
+        return submitted
+    
+    @_retry_transient
+    def _wait_for_completion(self, transcript: aai.Transcript) -> aai.Transcript:
+        """Poll a submitted transcript until it is completed or has failed"""
+        try:
+            return transcript.wait_for_completion()
+        except Exception as e:
+            raise _service_error(e) from e
+    
+    def _build_result(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Assemble the transcription result from the raw AssemblyAI fields,
+        splitting the transcript into sentences once for the summary, action
+        items and key points
+        """
+        transcript_text = raw["text"] or _NO_TRANSCRIPT
+        ai_summary = raw["summary"]
+        sentences = _split_sentences(transcript_text)
+        
+        # If no AI summary, create a simple one
+        if not ai_summary:
+            ai_summary = self.create_simple_summary(transcript_text, sentences)
+        
+        return {
+            "transcript": transcript_text,
+            "summary": ai_summary,
+            # One automaton pass over the whole transcript beats checking each sentence
+            "action_items": self.extract_action_items(transcript_text),
+            "key_points": self.extract_key_points(ai_summary, transcript_text, sentences),
+            "chapters": raw["chapters"],
+            "confidence": raw["confidence"],
+            "audio_duration": raw["audio_duration"]
+        }
+    
+    def _cache_path(self, cache_key: str) -> Path:
+        """Cache file for an audio content hash in the current cache layout"""
+        return self.cache_dir / f"{cache_key}.v{_CACHE_VERSION}.json"
+    
+    def _load_cached_result(self, cache_key: str):
+        """
+        Return the cached raw AssemblyAI fields for an audio content hash, or None
+        """
+        cache_path = self._cache_path(cache_key)
+        try:
+            with open(cache_path, "rb") as f:
+                return orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return None
+    
+    def _store_cached_result(self, cache_key: str, raw: Dict[str, Any]):
+        """
+        Cache the raw AssemblyAI fields under their audio content hash
+        """
+        # Write to a temporary file first so readers never see a partial entry
+        cache_path = self._cache_path(cache_key)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(raw))
+        os.replace(tmp_path, cache_path)
+    
+    async def _poll_transcript(self, transcript_id: str) -> Dict[str, Any]:
+        """
+        Poll a submitted transcript until it is completed or has failed
+        """
+        url = f"{aai.settings.base_url}/v2/transcript/{transcript_id}"
+        headers = {"authorization": aai.settings.api_key}
+        
+        async with httpx.AsyncClient(headers=headers, timeout=aai.settings.http_timeout) as client:
+            attempt = 0
+            while True:
+                response = await _get_transcript(client, url)
+                
+                # Back off for as long as the API asks when rate limited
+                if response.status_code == 429:
+                    retry_after = response.headers.get("Retry-After", "")
+                    await asyncio.sleep(
+                        int(retry_after) if retry_after.isdigit()
+                        else _POLL_INTERVALS[min(attempt, len(_POLL_INTERVALS) - 1)]
+                    )
+                    attempt += 1
+                    continue
+                
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                
+                if data["status"] in ("completed", "error"):
+                    return data
+                
+                await asyncio.sleep(_POLL_INTERVALS[min(attempt, len(_POLL_INTERVALS) - 1)])
+                attempt += 1
+    
+    def create_simple_summary(self, transcript_text: str, sentences: Optional[List[str]] = None) -> str:
         """
         Create a simple summary from transcript text
+        
+        Pass sentences when the transcript has already been split.
         """
         if not transcript_text or len(transcript_text.strip()) < 10:
             return "Short audio clip with minimal content."
         
         # Split into sentences
-        sentences = re.split(r'[.!?]+', transcript_text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        if sentences is None:
+            sentences = _split_sentences(transcript_text)
         
         if len(sentences) <= 2:
             return f"Brief audio containing: {transcript_text[:100]}..."
         
-        # Take first and last sentences for simple summary
-        first_part = sentences[0]
-        last_part = sentences[-1] if len(sentences) > 1 else ""
-        
-        summary = f"The audio discusses {first_part.lower()}"
-        if last_part:
-            summary += f" and concludes with {last_part.lower()}"
+        # Take first and last sentences for simple summary, truncating before
+        # lowercasing so very long sentences are never copied in full
+        first_part = sentences[0][:_SUMMARY_PART_LENGTH].lower()
+        last_part = sentences[-1][:_SUMMARY_PART_LENGTH].lower()
         
-        return summary + "."
+        return "".join(("The audio discusses ", first_part, " and concludes with ", last_part, "."))
     
-    def extract_action_items(self, transcript_text: str) -> list:
+    def extract_action_items(self, transcript_text: str, sentences: Optional[List[str]] = None) -> list:
         """
         Extract action items from transcript (improved keyword-based approach)
+        
+        Pass sentences when the transcript has already been split.
         """
         if not transcript_text:
             return []
-            
-        action_keywords = [
-            "need to", "should", "must", "have to", "will",
-            "action", "todo", "to do", "follow up", "next step",
-            "assign", "responsible", "deadline", "schedule",
-            "contact", "email", "call", "meeting", "send",
-            "remember", "don't forget", "make sure"
-        ]
         
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', transcript_text)
+        # Matching sentences are produced lazily so the scan stops as soon as
+        # enough items are found
+        if sentences is None:
+            matches = _iter_action_sentences(transcript_text)
+        else:
+            matches = (sentence for sentence in sentences if _has_action_keyword(sentence))
         action_items = []
         
-        for sentence in sentences:
-            sentence = sentence.strip()
+        for sentence in matches:
             if len(sentence) < 5:  # Skip very short sentences
                 continue
-                
-            sentence_lower = sentence.lower()
-            if any(keyword in sentence_lower for keyword in action_keywords):
-                # Clean up the sentence
-                clean_sentence = sentence.capitalize()
-                if not clean_sentence.endswith('.'):
-                    clean_sentence += '.'
-                action_items.append(clean_sentence)
+            
+            # Clean up the sentence
+            clean_sentence = sentence.capitalize()
+            if not clean_sentence.endswith('.'):
+                clean_sentence += '.'
+            action_items.append(clean_sentence)
+            if len(action_items) == 5:  # Return max 5 action items
+                break
         
         # If no action items found, create some based on content
         if not action_items and transcript_text:
@@ -140,20 +695,23 @@ class TranscriptionService:
             else:
                 action_items.append("Review recording content for further action.")
         
-        return action_items[:5]  # Return max 5 action items
+        return action_items
     
-    def extract_key_points(self, summary: str, transcript: str = "") -> list:
+    def extract_key_points(
+        self, summary: str, transcript: str = "", transcript_sentences: Optional[List[str]] = None
+    ) -> list:
         """
         Extract key points from summary and transcript
+        
+        Pass transcript_sentences when the transcript has already been split.
         """
         points = []
         
         # Extract from summary
         if summary:
             # Split by common delimiters
-            summary_points = re.split(r'[.!?;]+', summary)
+            summary_points = _split_sentences(summary, _POINT_TABLE)
             for point in summary_points:
-                point = point.strip()
                 if len(point) > 15:  # Filter out very short points
                     clean_point = point.capitalize()
                     if not clean_point.endswith('.'):
@@ -162,21 +720,21 @@ class TranscriptionService:
         
         # If we don't have enough points, extract from transcript
         if len(points) < 3 and transcript:
-            transcript_sentences = re.split(r'[.!?]+', transcript)
+            if transcript_sentences is None:
+                transcript_sentences = _split_sentences(transcript)
             for sentence in transcript_sentences[:3]:  # Take first 3 sentences
-                sentence = sentence.strip()
                 if len(sentence) > 20:
                     clean_sentence = sentence.capitalize()
                     if not clean_sentence.endswith('.'):
                         clean_sentence += '.'
                     points.append(clean_sentence)
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_points = []
-        for point in points:
-            if point.lower() not in seen:
-                seen.add(point.lower())
-                unique_points.append(point)
+        # Remove duplicates while preserving order (dicts keep insertion order;
+        # points are capitalized, so case-insensitive duplicates are identical)
+        unique_points = list({point.lower(): point for point in points}.values())
         
         return unique_points[:5]  # Return max 5 key points
+
+
+# Shared service instance used by the API and the Celery worker
+transcription_service = TranscriptionService()